@@ -1,7 +1,11 @@
-"""Typing with ABC class for pycrostates classes.
+"""Typing classes for pycrostates classes.
 
 The type class can be used for type hinting for pycrostates classes that are at
 risk of circular imports, or for short-cut types re-grouping different types.
+
+CHData and CHInfo are plain classes: deriving from ABC would make every isinstance
+check against ChData and ChInfo go through ABCMeta.__instancecheck__. Cluster is
+an ABC as the abstract methods of the clustering base class rely on ABCMeta.
 """
 
 from abc import ABC
@@ -11,13 +15,13 @@ from numpy.random import Generator, RandomState
 from numpy.typing import NDArray
 
 
-class CHData(ABC):
+class CHData:
     """Typing for CHData."""
 
     pass
 
 
-class CHInfo(ABC):
+class CHInfo:
     """Typing for CHInfo."""
 
     pass
@@ -0,0 +1,92 @@
+"""Numba kernels for the GFP peaks extraction.
+
+This module requires ``numba`` and is imported lazily by
+:func:`~pycrostates.preprocessing.extract_gfp_peaks.extract_gfp_peaks`, which falls
+back on :func:`scipy.signal.find_peaks` when ``numba`` is not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# parallel=True is not used as the default numba threading layer (workqueue) does
+# not support concurrent calls, e.g. from the threads processing epochs in parallel.
+@njit(cache=True, nogil=True)
+def _gfp_numba(data):
+    """Compute the GFP in a single pass over the data of shape (n_ch, n_samples)."""
+    n_channels, n_samples = data.shape
+    # the accumulators are in float64, the output keeps the precision of the input
+    gfp = np.empty(n_samples, dtype=data.dtype)
+    for j in range(n_samples):
+        acc = 0.0
+        acc2 = 0.0
+        for i in range(n_channels):
+            v = data[i, j]
+            acc += v
+            acc2 += v * v
+        mean = acc / n_channels
+        var = acc2 / n_channels - mean * mean
+        # NaNs propagate as in the numpy implementation
+        gfp[j] = 0.0 if var <= 0 else np.sqrt(var)
+    return gfp
+
+
+@njit(cache=True, nogil=True)
+def _local_maxima_numba(x):
+    """Find the local maxima in x, c.f. scipy.signal._peak_finding_utils."""
+    peaks = np.empty(x.size // 2, dtype=np.int64)
+    n_peaks = 0
+    i = 1
+    i_max = x.size - 1
+    while i < i_max:
+        if x[i - 1] < x[i]:
+            i_ahead = i + 1
+            # skip plateaus and use their midpoints as peaks
+            while i_ahead < i_max and x[i_ahead] == x[i]:
+                i_ahead += 1
+            if x[i_ahead] < x[i]:
+                peaks[n_peaks] = (i + i_ahead - 1) // 2
+                n_peaks += 1
+                i = i_ahead
+        i += 1
+    return peaks[:n_peaks]
+
+
+@njit(cache=True, nogil=True)
+def _select_by_peak_distance_numba(peaks, priority_to_position, distance):
+    """Remove the smallest peaks until the distance condition is fulfilled.
+
+    c.f. scipy.signal._peak_finding_utils._select_by_peak_distance
+    """
+    n_peaks = peaks.size
+    keep = np.ones(n_peaks, dtype=np.bool_)
+    for i in range(n_peaks - 1, -1, -1):
+        j = priority_to_position[i]
+        if not keep[j]:
+            continue
+        k = j - 1
+        while 0 <= k and peaks[j] - peaks[k] < distance:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < n_peaks and peaks[k] - peaks[j] < distance:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
+
+
+def _extract_gfp_peaks_numba(data, min_peak_distance):
+    """Extract the indices of the GFP peaks from data of shape (n_ch, n_samples).
+
+    Same semantic as :func:`scipy.signal.find_peaks` with ``distance`` set to
+    ``min_peak_distance``. The peaks are sorted by height with :func:`numpy.argsort`,
+    as in scipy, so that ties between peaks are resolved identically.
+    """
+    gfp = _gfp_numba(data)
+    peaks = _local_maxima_numba(gfp)
+    if min_peak_distance <= 1 or peaks.size == 0:
+        return peaks
+    priority_to_position = np.argsort(gfp[peaks])
+    return _select_by_peak_distance_numba(
+        peaks, priority_to_position, min_peak_distance
+    )
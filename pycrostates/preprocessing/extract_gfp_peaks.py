@@ -1,9 +1,12 @@
 """Preprocessing functions to extract gfp peaks."""
-from typing import Optional, Union
+
+from functools import lru_cache
+from typing import Callable, Optional, Union
 
 import numpy as np
 from mne import BaseEpochs, pick_info
 from mne.io import BaseRaw
+from mne.parallel import parallel_func
 from mne.utils import check_version
 from numpy.typing import NDArray
 from scipy.signal import find_peaks
@@ -14,7 +17,9 @@ else:
     from mne.io.pick import _picks_to_idx
 
 from .._typing import CHData, Picks
+from ..utils import _get_data_raw, _iter_data_epochs
 from ..utils._checks import (
+    _check_n_jobs,
     _check_picks_uniqueness,
     _check_reject_by_annotation,
     _check_tmin_tmax,
@@ -34,6 +39,7 @@ def extract_gfp_peaks(
     tmin: Optional[float] = None,
     tmax: Optional[float] = None,
     reject_by_annotation: bool = True,
+    n_jobs: int = 1,
     verbose=None,
 ) -> CHData:
     """:term:`Global Field Power` (:term:`GFP`) peaks extraction.
@@ -64,6 +70,7 @@ def extract_gfp_peaks(
     %(tmin_raw)s
     %(tmax_raw)s
     %(reject_by_annotation_raw)s
+    %(n_jobs)s
     %(verbose)s
 
     Returns
@@ -76,11 +83,16 @@ def extract_gfp_peaks(
     The :term:`Global Field Power` (:term:`GFP`) peaks are extracted with
     :func:`scipy.signal.find_peaks`. Only the ``distance`` argument is filled with the
     value provided in ``min_peak_distance``. The other arguments are set to their
-    default values.
+    default values. If ``numba`` is installed, a compiled implementation with the same
+    semantic is used instead.
+
+    For :class:`~mne.Epochs`, the epochs are processed in parallel when ``n_jobs``
+    is different from ``1``.
     """
     from ..io import ChData
 
     _check_type(inst, (BaseRaw, BaseEpochs), "inst")
+    _check_type(return_all, (bool,), "return_all")
     _check_type(min_peak_distance, ("int",), "min_peak_distance")
     if min_peak_distance < 1:
         raise ValueError(
@@ -88,47 +100,65 @@ def extract_gfp_peaks(
             f"equal to 1. Provided: {min_peak_distance}."
         )
     tmin, tmax = _check_tmin_tmax(inst, tmin, tmax)
+    n_jobs = _check_n_jobs(n_jobs)
+    # set kwargs for .get_data()
+    kwargs = dict(tmin=tmin, tmax=tmax)
     if isinstance(inst, BaseRaw):
-        reject_by_annotation = _check_reject_by_annotation(reject_by_annotation)
+        kwargs["reject_by_annotation"] = _check_reject_by_annotation(
+            reject_by_annotation
+        )
 
     # retrieve picks
     picks = _picks_to_idx(inst.info, picks, none="all", exclude="bads")
     picks_all = _picks_to_idx(inst.info, inst.ch_names, none="all", exclude="bads")
     _check_picks_uniqueness(inst.info, picks)
 
-    # set kwargs for .get_data()
-    kwargs = dict(tmin=tmin, tmax=tmax)
-    if isinstance(inst, BaseRaw):
-        kwargs["reject_by_annotation"] = reject_by_annotation
-
     # extract GFP peaks
     if isinstance(inst, BaseRaw):
         # retrieve data array on which we look for GFP peaks
-        data = inst.get_data(picks=picks, **kwargs)
+        data = _get_data_raw(inst, picks, **kwargs)
         # retrieve indices of GFP peaks
         ind_peaks = _extract_gfp_peaks(data, min_peak_distance)
         # retrieve the peaks data
         if return_all:
             del data  # free up memory
-            data = inst.get_data(picks=picks_all, **kwargs)
+            data = _get_data_raw(inst, picks_all, **kwargs)
         peaks = data[:, ind_peaks]
+        # number of samples retrieved, i.e. after tmin/tmax and reject_by_annotation
+        n_samples = data.shape[-1]
     elif isinstance(inst, BaseEpochs):
-        peaks = list()  # run epoch per epoch
-        for k in range(len(inst)):  # pylint: disable=consider-using-enumerate
-            data = inst[k].get_data(picks=picks, **kwargs)[0, :, :]
-            # data is 2D, of shape (n_channels, n_samples)
-            ind_peaks = _extract_gfp_peaks(data, min_peak_distance)
-            if return_all:
-                del data  # free up memory
-                data = inst[k].get_data(picks=picks_all, **kwargs)[0, :, :]
-            peaks.append(data[:, ind_peaks])
-        peaks = np.hstack(peaks)
-
-    n_samples = inst.times.size
-    if isinstance(inst, BaseEpochs):
-        n_samples *= len(inst)
+        # the epochs are retrieved one at a time to avoid a copy of the entire data
+        epochs_data = _iter_data_epochs(inst, picks, **kwargs)
+        if n_jobs == 1:
+            ind_peaks = [
+                _extract_gfp_peaks(epoch, min_peak_distance) for epoch in epochs_data
+            ]
+        else:
+            # the kernels release the GIL, threads avoid copying the epochs
+            parallel, p_fun, _ = parallel_func(
+                _extract_gfp_peaks, n_jobs, prefer="threads"
+            )
+            ind_peaks = parallel(
+                p_fun(epoch, min_peak_distance) for epoch in epochs_data
+            )
+        # gather the peaks data of every epoch in a single pre-allocated array
+        offsets = np.cumsum([0] + [ind.size for ind in ind_peaks])
+        picks_peaks = picks_all if return_all else picks
+        dtype = inst._data.dtype if inst.preload else np.float64
+        peaks = np.empty((picks_peaks.size, offsets[-1]), dtype=dtype)
+        epochs_data = _iter_data_epochs(inst, picks_peaks, **kwargs)
+        for epoch, ind, start, stop in zip(
+            epochs_data, ind_peaks, offsets, offsets[1:]
+        ):
+            # the indices are valid, mode='clip' avoids buffering the output in a copy
+            np.take(epoch, ind, axis=1, out=peaks[:, start:stop], mode="clip")
+        # number of samples retrieved, i.e. after tmin/tmax and the rejection of bad
+        # epochs on non-preloaded instances
+        tstart, tstop = inst._handle_tmin_tmax(tmin, tmax)
+        n_samples = len(ind_peaks) * (tstop - tstart)
+
     logger.info(
-        "%s GFP peaks extracted out of %s samples (%.2f%% of the original data).",
+        "%i GFP peaks extracted out of %i samples (%.2f%% of the original data).",
         peaks.shape[1],
         n_samples,
         peaks.shape[1] / n_samples * 100,
@@ -150,13 +180,59 @@ def _extract_gfp_peaks(
     min_peak_distance : int
         Required minimal horizontal distance (>= 1) in samples between neighboring
         peaks. Smaller peaks are removed first until the condition is fulfilled for all
-        remaining peaks. Default to 2.
+        remaining peaks. Default to 2. The value is not validated, the caller is
+        responsible for it.
 
     Returns
     -------
     peaks : array of shape (n_picks,)
         The indices when peaks occur.
     """
-    gfp = np.std(data, axis=0)
-    peaks, _ = find_peaks(gfp, distance=min_peak_distance)
+    kernel = _get_numba_kernel()
+    if kernel is not None:
+        return kernel(data, min_peak_distance)
+    gfp = _gfp(data)
+    # a distance of 1 sample does not remove any peak
+    distance = min_peak_distance if 1 < min_peak_distance else None
+    peaks, _ = find_peaks(gfp, distance=distance)
     return peaks
+
+
+@lru_cache(maxsize=1)
+def _get_numba_kernel() -> Optional[Callable]:
+    """Lazily import the numba GFP peaks kernel, or None if numba is missing."""
+    try:
+        from ._extract_gfp_peaks_numba import _extract_gfp_peaks_numba
+    except ImportError:
+        return None
+    return _extract_gfp_peaks_numba
+
+
+def _gfp(data: NDArray[float]) -> NDArray[float]:
+    """Compute the global field power, i.e. the spatial standard deviation.
+
+    Equivalent to ``np.std(data, axis=0)``, but computed from the sum and the sum of
+    squares across channels to avoid the temporary arrays allocated by
+    :func:`numpy.std` for the mean subtraction and the squared deviations.
+
+    Parameters
+    ----------
+    data : array of shape (n_channels, n_samples)
+        The data from which the GFP is computed.
+
+    Returns
+    -------
+    gfp : array of shape (n_samples,)
+        The global field power.
+    """
+    # the reductions over axis 0 add contiguous channel rows, thus a channel-last
+    # (n_samples, n_channels) copy of the data would not be faster.
+    # the sums are accumulated in float64 since the difference between the mean of
+    # the squares and the squared mean cancels out most significant digits when the
+    # channels share a large offset.
+    n_channels = data.shape[0]
+    mean = data.sum(axis=0, dtype=np.float64) / n_channels
+    var = np.einsum("ij,ij->j", data, data, dtype=np.float64) / n_channels - mean**2
+    # rounding errors can yield slightly negative variances on flat samples
+    gfp = np.sqrt(np.clip(var, 0, None, out=var), out=var)
+    return gfp.astype(data.dtype, copy=False)
@@ -5,7 +5,9 @@ from typing import List, Optional, Union
 import numpy as np
 from mne import BaseEpochs, pick_info
 from mne.io import BaseRaw
+from mne.parallel import parallel_func
 from mne.utils import check_version
+from numpy.typing import NDArray
 
 if check_version("mne", "1.6"):
     from mne._fiff.pick import _picks_to_idx
@@ -13,7 +15,9 @@ else:
     from mne.io.pick import _picks_to_idx
 
 from .._typing import CHData, Picks, RANDomState
+from ..utils import _get_data_raw
 from ..utils._checks import (
+    _check_n_jobs,
     _check_random_state,
     _check_reject_by_annotation,
     _check_tmin_tmax,
@@ -36,6 +40,7 @@ def resample(
     coverage: float = None,
     replace: bool = True,
     random_state: RANDomState = None,
+    n_jobs: int = 1,
     verbose=None,
 ) -> List[CHData]:
     """Resample a recording into epochs of random samples.
@@ -63,6 +68,7 @@ def resample(
     replace : bool
         Whether or not to allow resampling with replacement.
     %(random_state)s
+    %(n_jobs)s
     %(verbose)s
 
     Returns
@@ -74,6 +80,10 @@ def resample(
     -----
     Only two of ``n_resamples``, ``n_samples`` and ``coverage`` parameters must be
     defined, the non-defined one will be determine at runtime by the 2 other parameters.
+
+    When resampling with replacement, each resample is drawn from an independent
+    random stream spawned from ``random_state``. Thus, the resamples can be drawn in
+    parallel and the output does not depend on ``n_jobs``.
     """
     from ..io import ChData
 
@@ -87,6 +97,7 @@ def resample(
     _check_type(coverage, (None, "numeric"), "coverage")
     _check_type(replace, (bool,), "replace")
     random_state = _check_random_state(random_state)
+    n_jobs = _check_n_jobs(n_jobs)
 
     # Check n_samples, coverage
     if n_resamples is not None:
@@ -132,6 +143,18 @@ def resample(
                 f"Provided: '{coverage}'."
             )
 
+    # the number of samples of the instance is an upper bound of the number of
+    # samples retrieved with tmin/tmax/reject_by_annotation, thus it can be used to
+    # reject impossible draws before loading the data
+    if replace is False and n_resamples is not None and n_samples is not None:
+        if isinstance(inst, BaseRaw):
+            n_times = inst.n_times
+        elif isinstance(inst, BaseEpochs):
+            n_times = len(inst.events) * inst.times.size
+        else:
+            n_times = inst._data.shape[-1]  # pylint: disable=protected-access
+        _check_n_samples_without_replacement(n_resamples, n_samples, n_times)
+
     # retrieve picks
     picks = _picks_to_idx(inst.info, picks, none="all", exclude="bads")
 
@@ -139,12 +162,12 @@ def resample(
     kwargs = dict() if isinstance(inst, ChData) else dict(tmin=tmin, tmax=tmax)
     if isinstance(inst, BaseRaw):
         kwargs["reject_by_annotation"] = reject_by_annotation
-    data = inst.get_data(picks=picks, **kwargs)
+        data = _get_data_raw(inst, picks, **kwargs)
+    else:
+        data = inst.get_data(picks=picks, **kwargs)
     assert data.ndim in (2, 3)  # sanity-check
-    if isinstance(inst, BaseEpochs):
-        data = np.hstack(data)
-    assert data.ndim == 2  # sanity-check
-    n_times = data.shape[1]
+    # epochs are considered concatenated along the time axis, without copy
+    n_times = data.shape[-1] if data.ndim == 2 else data.shape[0] * data.shape[-1]
 
     # Compute coverage / n_samples from the second
     if n_resamples is None:
@@ -157,13 +180,7 @@ def resample(
         coverage = (n_resamples * n_samples) / n_times
 
     if replace is False:
-        if n_resamples * n_samples > n_times:
-            raise ValueError(
-                f"Can not draw {n_resamples} resamples of {n_samples} "
-                f"samples = {n_resamples * n_samples} samples without "
-                f"replacement because the instance contains only "
-                f"{n_times} samples."
-            )
+        _check_n_samples_without_replacement(n_resamples, n_samples, n_times)
 
     logger.info(
         "Resampling instance into %s resamples of %s samples "
@@ -173,20 +190,107 @@ def resample(
         coverage * 100,
     )
 
-    # random selection
-    times_idx = np.arange(n_times)
-    indices = random_state.choice(
-        times_idx, size=n_resamples * n_samples, replace=replace
-    )
-    indices = indices.reshape((n_resamples, n_samples))
-
-    # select data
-    data = data[:, indices]
-    data = np.swapaxes(data, 0, 1)
+    # random_state can be a RandomState or a Generator, both support bytes()
+    seed_seq = np.random.SeedSequence(int.from_bytes(random_state.bytes(16), "little"))
+    if replace:
+        # spawn an independent random stream per resample
+        seeds = seed_seq.spawn(n_resamples)
+        if n_jobs == 1:
+            resamples_data = [_draw_resample(data, n_samples, seed) for seed in seeds]
+        else:
+            parallel, p_fun, _ = parallel_func(
+                _draw_resample, n_jobs, total=n_resamples, prefer="threads"
+            )
+            resamples_data = parallel(p_fun(data, n_samples, seed) for seed in seeds)
+    else:
+        # Generator.choice() shuffles only the drawn samples or uses Floyd's algorithm
+        # while RandomState.choice() permutes the entire population
+        rng = np.random.default_rng(seed_seq)
+        indices = rng.choice(n_times, size=(n_resamples, n_samples), replace=False)
+        # select data, gathered directly in a C-contiguous array of shape
+        # (n_resamples, n_channels, n_samples). A single gather in an array of shape
+        # (n_channels, n_resamples * n_samples) would move as many bytes, but each
+        # resample would then be a non-contiguous view on this array.
+        resamples_data = np.empty(
+            (n_resamples, data.shape[-2], n_samples), dtype=data.dtype
+        )
+        for d, idx in zip(resamples_data, indices):
+            _take_samples(data, idx, out=d)
+    del data  # free up memory
 
-    # create list of ChData
+    # create list of ChData, the info is picked once but each ChData converts it to
+    # its own ChInfo since ChData.pick() modifies the info in-place.
     info = pick_info(inst.info, picks)
-    resamples = list()
-    for d in data:
-        resamples.append(ChData(d, info))
-    return resamples
+    return [ChData(d, info) for d in resamples_data]
+
+
+def _check_n_samples_without_replacement(
+    n_resamples: int, n_samples: int, n_times: int
+) -> None:
+    """Check that enough samples are available to draw without replacement."""
+    if n_resamples * n_samples > n_times:
+        raise ValueError(
+            f"Can not draw {n_resamples} resamples of {n_samples} "
+            f"samples = {n_resamples * n_samples} samples without "
+            f"replacement because the instance contains only "
+            f"{n_times} samples."
+        )
+
+
+def _draw_resample(
+    data: NDArray[float], n_samples: int, seed: np.random.SeedSequence
+) -> NDArray[float]:
+    """Draw a resample with replacement.
+
+    Parameters
+    ----------
+    data : array of shape (n_channels, n_times) | (n_epochs, n_channels, n_times)
+        The data to resample.
+    n_samples : int
+        Number of samples to draw.
+    seed : SeedSequence
+        Seed of the random stream used for this resample.
+
+    Returns
+    -------
+    resample : array of shape (n_channels, n_samples)
+        The resampled data.
+    """
+    rng = np.random.default_rng(seed)
+    n_times = data.shape[-1] if data.ndim == 2 else data.shape[0] * data.shape[-1]
+    indices = rng.integers(0, n_times, size=n_samples)
+    return _take_samples(data, indices)
+
+
+def _take_samples(
+    data: NDArray[float],
+    indices: NDArray[int],
+    out: Optional[NDArray[float]] = None,
+) -> NDArray[float]:
+    """Select samples along the time axis.
+
+    Parameters
+    ----------
+    data : array of shape (n_channels, n_times) | (n_epochs, n_channels, n_times)
+        The data from which samples are selected. Epochs are considered concatenated
+        along the time axis.
+    indices : array of shape (n_samples,)
+        The indices of the samples to select.
+    out : array of shape (n_channels, n_samples) | None
+        If provided, the samples are placed in this array.
+
+    Returns
+    -------
+    samples : array of shape (n_channels, n_samples)
+        The selected samples, C-contiguous.
+    """
+    if data.ndim == 2:
+        # the indices are valid, mode='clip' avoids buffering the output in a copy
+        return np.take(data, indices, axis=1, out=out, mode="clip")
+    epochs_idx, times_idx = np.divmod(indices, data.shape[-1])
+    # the gather yields an array of shape (n_samples, n_channels)
+    samples = data[epochs_idx, :, times_idx].T
+    if out is None:
+        return np.ascontiguousarray(samples)
+    out[:] = samples
+    return out
@@ -29,11 +29,9 @@ def _check_adjacency(adjacency, info, ch_type):
     # auto
     if isinstance(adjacency, str):
         if adjacency != "auto":
-            raise (
-                ValueError(
-                    f"Adjacency can be either a scipy.sparse.csr_matrix"
-                    f"or 'auto' but got string '{adjacency}' instead."
-                )
+            raise ValueError(
+                "Adjacency can be either a scipy.sparse.csr_matrix "
+                f"or 'auto' but got string '{adjacency}' instead."
             )
         adjacency, ch_names = find_ch_adjacency(info, ch_type)
     # custom
@@ -1,8 +1,13 @@
+from importlib import import_module
+
 import mne
+import numpy as np
 import pytest
 from mne import pick_info
 from mne.datasets import testing
 from mne.utils import check_version
+from numpy.testing import assert_allclose
+from scipy.signal import find_peaks
 
 if check_version("mne", "1.6"):
     from mne._fiff.pick import _picks_to_idx
@@ -11,6 +16,7 @@ else:
 
 from pycrostates.io import ChData
 from pycrostates.preprocessing import extract_gfp_peaks
+from pycrostates.preprocessing.extract_gfp_peaks import _extract_gfp_peaks, _gfp
 from pycrostates.utils._logs import logger
 
 logger.propagate = True
@@ -52,8 +58,34 @@ def test_extract_gfp(inst, caplog):
     # with tmin/tmax
     tmin = None
     tmax = 1
+    caplog.clear()
     ch_data = extract_gfp_peaks(inst, tmin=tmin, tmax=tmax)
     assert isinstance(ch_data, ChData)
+    data = inst.get_data(picks="eeg", tmin=tmin, tmax=tmax)
+    n_samples = data.shape[-1] if data.ndim == 2 else data.shape[0] * data.shape[-1]
+    assert f"out of {n_samples} samples" in caplog.text
+
+    # with n_jobs
+    ch_data = extract_gfp_peaks(inst, n_jobs=1)
+    ch_data2 = extract_gfp_peaks(inst, n_jobs=2)
+    assert ch_data == ch_data2
+
+
+def test_extract_gfp_epochs_not_preloaded():
+    """Test extraction of GFP peaks from epochs which are not preloaded."""
+    events = mne.make_fixed_length_events(raw, duration=2)
+    tmax = 2 - 1 / raw.info["sfreq"]
+    # reject half of the epochs, which are only dropped when loaded
+    ptp = np.ptp(epochs.get_data(), axis=-1).max(axis=-1)
+    reject = dict(eeg=np.median(ptp))
+    epochs_ = mne.Epochs(
+        raw, events, tmin=0, tmax=tmax, baseline=None, reject=reject, preload=False
+    )
+    for kwargs in (dict(), dict(return_all=True), dict(tmin=0.5, n_jobs=2)):
+        ch_data = extract_gfp_peaks(epochs_, **kwargs)
+        assert not epochs_.preload
+        ch_data2 = extract_gfp_peaks(epochs_.copy().load_data(), **kwargs)
+        assert ch_data == ch_data2
 
 
 @pytest.mark.parametrize("inst", (raw, epochs))
@@ -61,7 +93,72 @@ def test_extract_gfp_invalid_arguments(inst):
     """Test errors raised when invalid arguments are provided."""
     with pytest.raises(TypeError, match="'inst' must be an instance of "):
         extract_gfp_peaks(101)
+    with pytest.raises(TypeError, match="'return_all' must be an instance"):
+        extract_gfp_peaks(inst, return_all=1)
     with pytest.raises(TypeError, match="'min_peak_distance' must be an instance"):
         extract_gfp_peaks(inst, min_peak_distance=True)
     with pytest.raises(ValueError, match="Argument 'min_peak_distance' must be"):
         extract_gfp_peaks(inst, min_peak_distance=-2)
+
+
+def test_gfp():
+    """Test the GFP computation against the spatial standard deviation."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((32, 1000)) * 1e-5
+    assert_allclose(_gfp(data), np.std(data, axis=0))
+    # flat samples must not yield NaNs
+    data[:, :10] = 0.1
+    gfp = _gfp(data)
+    assert not np.any(np.isnan(gfp))
+    assert_allclose(gfp[:10], 0, atol=1e-6)
+    # single precision is preserved
+    gfp = _gfp(data.astype(np.float32))
+    assert gfp.dtype == np.float32
+    assert_allclose(gfp[10:], np.std(data, axis=0)[10:], rtol=1e-4)
+    # single precision with a large offset shared across channels
+    data = (3e-2 + rng.standard_normal((64, 1000)) * 1e-6).astype(np.float32)
+    gfp = _gfp(data)
+    assert gfp.dtype == np.float32
+    assert_allclose(gfp, np.std(data.astype(np.float64), axis=0), rtol=1e-3)
+
+
+@pytest.mark.parametrize("min_peak_distance", (1, 2, 3, 10))
+def test_extract_gfp_peaks_numba(min_peak_distance):
+    """Test that the numba kernel matches scipy.signal.find_peaks."""
+    pytest.importorskip("numba")
+    from pycrostates.preprocessing._extract_gfp_peaks_numba import (
+        _extract_gfp_peaks_numba,
+        _gfp_numba,
+    )
+
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((32, 1000)) * 1e-5
+    gfp = _gfp_numba(data)
+    assert_allclose(gfp, np.std(data, axis=0))
+    assert _gfp_numba(data.astype(np.float32)).dtype == np.float32
+    # NaNs are propagated as in the numpy implementation
+    data_nan = data.copy()
+    data_nan[0, 10] = np.nan
+    assert_allclose(_gfp_numba(data_nan), _gfp(data_nan))
+    assert np.isnan(_gfp_numba(data_nan)[10])
+    peaks, _ = find_peaks(gfp, distance=min_peak_distance)
+    assert np.array_equal(_extract_gfp_peaks_numba(data, min_peak_distance), peaks)
+    # integer values yield plateaus and peaks of equal heights
+    data = rng.integers(0, 5, size=(3, 1000)).astype(float)
+    peaks, _ = find_peaks(_gfp_numba(data), distance=min_peak_distance)
+    assert np.array_equal(_extract_gfp_peaks_numba(data, min_peak_distance), peaks)
+
+
+@pytest.mark.parametrize("min_peak_distance", (1, 2, 10))
+def test_extract_gfp_peaks_scipy(min_peak_distance, monkeypatch):
+    """Test the scipy fallback used when numba is not installed."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((32, 1000)) * 1e-5
+    peaks = _extract_gfp_peaks(data, min_peak_distance)
+    # the module is shadowed by the function of the same name in the package
+    module = import_module("pycrostates.preprocessing.extract_gfp_peaks")
+    monkeypatch.setattr(module, "_get_numba_kernel", lambda: None)
+    peaks_scipy = _extract_gfp_peaks(data, min_peak_distance)
+    assert np.array_equal(peaks, peaks_scipy)
+    expected, _ = find_peaks(np.std(data, axis=0), distance=min_peak_distance)
+    assert np.array_equal(peaks_scipy, expected)
@@ -1,4 +1,5 @@
 import itertools
+from importlib import import_module
 
 import mne
 import numpy as np
@@ -15,6 +16,7 @@ else:
 
 from pycrostates.io import ChData
 from pycrostates.preprocessing import resample
+from pycrostates.preprocessing.resample import _take_samples
 
 dir_ = testing.data_path() / "MEG" / "sample"
 fname_raw_testing = dir_ / "sample_audvis_trunc_raw.fif"
@@ -103,6 +105,16 @@ def test_resample_n_samples_coverage(inst, replace, n_samples, cov):
         assert r._data.shape == (n_ch, n_samples)
 
 
+@pytest.mark.parametrize(
+    "inst, replace", itertools.product((raw, epochs), (True, False))
+)
+def test_resample_contiguous(inst, replace):
+    """Test that the resampled data arrays are C-contiguous."""
+    resamples = resample(inst, n_resamples=3, n_samples=100, replace=replace)
+    for r in resamples:
+        assert r._data.flags["C_CONTIGUOUS"]
+
+
 def test_resample_raw_noreplace_error():
     """Test error raised when replace is False and not enough samples are
     available."""
@@ -111,6 +123,30 @@ def test_resample_raw_noreplace_error():
     resample(raw, n_resamples=1000, n_samples=5000, replace=True)
 
 
+def test_resample_noreplace_error_before_loading(monkeypatch):
+    """Test that impossible draws are rejected before retrieving the data."""
+
+    def get_data(*args, **kwargs):
+        raise RuntimeError("Data should not be retrieved.")
+
+    # the module is shadowed by the function of the same name in the package
+    module = import_module("pycrostates.preprocessing.resample")
+    monkeypatch.setattr(module, "_get_data_raw", get_data)
+    monkeypatch.setattr(type(epochs), "get_data", get_data)
+    for inst in (raw, epochs):
+        n_times = inst.times.size * (len(inst) if isinstance(inst, BaseEpochs) else 1)
+        with pytest.raises(ValueError, match="Can not draw 2 resamples"):
+            resample(inst, n_resamples=2, n_samples=n_times, replace=False)
+
+
+@pytest.mark.parametrize("inst", (raw, epochs))
+def test_resample_noreplace_unique(inst):
+    """Test that samples are drawn at most once when replace is False."""
+    resamples = resample(inst, n_resamples=10, n_samples=500, replace=False)
+    data = np.hstack([r._data for r in resamples])
+    assert np.unique(data, axis=1).shape[1] == data.shape[1]
+
+
 def test_n_resamples_n_samples_coverage_errors():
     """Test error raised by wrong combination of n_resamples, n_samples and
     coverage."""
@@ -142,3 +178,38 @@ def test_resample_random_state():
     resamples_0 = resample(raw, n_resamples=1, n_samples=500, random_state=42)[0]
     resamples_1 = resample(raw, n_resamples=1, n_samples=500, random_state=42)[0]
     assert_allclose(resamples_0._data, resamples_1._data)
+
+
+@pytest.mark.parametrize("inst", (raw, epochs))
+def test_resample_n_jobs(inst):
+    """Test that resampling in parallel yields the same resamples."""
+    resamples_0 = resample(inst, n_resamples=5, n_samples=500, random_state=42)
+    resamples_1 = resample(
+        inst, n_resamples=5, n_samples=500, random_state=42, n_jobs=2
+    )
+    for r0, r1 in zip(resamples_0, resamples_1):
+        assert_allclose(r0._data, r1._data)
+
+
+def test_take_samples():
+    """Test selection of samples from epochs concatenated along the time axis."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((4, 3, 50))  # (n_epochs, n_channels, n_times)
+    indices = rng.integers(0, 200, size=30)
+    samples = _take_samples(data, indices)
+    assert samples.flags["C_CONTIGUOUS"]
+    assert_allclose(samples, np.hstack(data)[:, indices])
+    assert_allclose(_take_samples(np.hstack(data), indices), samples)
+    out = np.empty((3, 30))
+    _take_samples(data, indices, out=out)
+    assert_allclose(out, samples)
+
+
+def test_resample_info_not_shared():
+    """Test that the resamples do not share the same measurement info."""
+    resamples = resample(raw, n_resamples=2, n_samples=100)
+    n_ch = len(resamples[1].ch_names)
+    resamples[0].pick(resamples[0].ch_names[:2])
+    assert len(resamples[0].ch_names) == 2
+    assert len(resamples[1].ch_names) == n_ch
+    assert resamples[0].info is not resamples[1].info
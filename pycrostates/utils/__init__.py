@@ -1,6 +1,12 @@
 """Utils module for utilities."""
 
 from ._config import get_config
-from .utils import _compare_infos, _corr_vectors, _distance_matrix  # noqa: F401
+from .utils import (  # noqa: F401
+    _compare_infos,
+    _corr_vectors,
+    _distance_matrix,
+    _get_data_raw,
+    _iter_data_epochs,
+)
 
 __all__ = ("get_config",)
@@ -11,7 +11,6 @@ from typing import Any
 
 import numpy as np
 from matplotlib.axes import Axes
-from mne import pick_info
 from mne.utils import check_random_state
 
 from ._docs import fill_doc
@@ -282,9 +281,9 @@ def _check_tmin_tmax(inst, tmin, tmax):
 
 def _check_picks_uniqueness(info, picks):
     """Check that the provided picks yield a single channel type."""
-    info = pick_info(info, picks, copy=True)
-    if len(info.get_channel_types(unique=True)) != 1:
-        ch_types = info.get_channel_types(unique=False)
+    # retrieve the channel types without copying the info with pick_info
+    ch_types = info.get_channel_types(picks=picks, unique=False)
+    if len(set(ch_types)) != 1:
         ch_types, counts = np.unique(ch_types, return_counts=True)
         channels_msg = ", ".join(
             "%s '%s' channel(s)" % t for t in zip(counts, ch_types)
@@ -1,9 +1,12 @@
+import numpy as np
 import pytest
-from mne import create_info
+from mne import Annotations, EpochsArray, create_info
+from mne.io import RawArray
 from mne.io.constants import FIFF
+from numpy.testing import assert_allclose
 
 from pycrostates.io import ChInfo
-from pycrostates.utils import _compare_infos
+from pycrostates.utils import _compare_infos, _get_data_raw, _iter_data_epochs
 from pycrostates.utils._logs import logger, set_log_level
 
 set_log_level("INFO")
@@ -84,3 +87,59 @@ def test_compare_infos(caplog):
     assert "does not have the same channels units" in caplog.text
     assert "does not have the same coordinate frames" in caplog.text
     assert "does not have the same channels kinds" in caplog.text
+
+
+def test_get_data_raw():
+    """Test retrieval of Raw data, as a view when possible."""
+    info = create_info(["Fpz", "Cz", "CPz", "Oz"], 100, "eeg")
+    data = np.random.default_rng(0).standard_normal((4, 1000))
+    raw = RawArray(data, info)
+
+    # view on the full recording
+    view = _get_data_raw(raw, np.arange(1, 3))
+    assert np.shares_memory(view, raw._data)
+    assert not view.flags.writeable
+    assert_allclose(view, raw.get_data(picks=[1, 2]))
+    view = _get_data_raw(raw, np.arange(4), reject_by_annotation="omit")
+    assert np.shares_memory(view, raw._data)
+
+    # copies
+    for picks, kwargs in (
+        (np.array([0, 2]), dict()),
+        (np.arange(4), dict(tmin=1)),
+        (np.arange(4), dict(tmax=5)),
+    ):
+        data = _get_data_raw(raw, picks, **kwargs)
+        assert not np.shares_memory(data, raw._data)
+        assert_allclose(data, raw.get_data(picks=picks, **kwargs))
+
+    # annotations
+    raw.set_annotations(Annotations(onset=[1], duration=[1], description=["bad"]))
+    data = _get_data_raw(raw, np.arange(4), reject_by_annotation="omit")
+    assert not np.shares_memory(data, raw._data)
+    assert data.shape == (4, 900)
+    view = _get_data_raw(raw, np.arange(4), reject_by_annotation=None)
+    assert np.shares_memory(view, raw._data)
+
+
+def test_iter_data_epochs():
+    """Test retrieval of Epochs data one epoch at a time."""
+    info = create_info(["Fpz", "Cz", "CPz", "Oz"], 100, "eeg")
+    data = np.random.default_rng(0).standard_normal((5, 4, 100))
+    epochs = EpochsArray(data, info)
+
+    # views on the epochs
+    epochs_data = list(_iter_data_epochs(epochs, np.arange(1, 3)))
+    assert len(epochs_data) == 5
+    for epoch in epochs_data:
+        assert np.shares_memory(epoch, epochs._data)
+        assert not epoch.flags.writeable
+    assert_allclose(epochs_data, epochs.get_data(picks=[1, 2]))
+    epochs_data = list(_iter_data_epochs(epochs, np.arange(4), tmin=0.1, tmax=0.5))
+    assert np.shares_memory(epochs_data[0], epochs._data)
+    assert_allclose(epochs_data, epochs.get_data(tmin=0.1, tmax=0.5))
+
+    # copies
+    epochs_data = list(_iter_data_epochs(epochs, np.array([0, 2])))
+    assert not np.shares_memory(epochs_data[0], epochs._data)
+    assert_allclose(epochs_data, epochs.get_data(picks=[0, 2]))
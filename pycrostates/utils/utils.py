@@ -132,3 +132,82 @@ def _compare_infos(cluster_info, inst_info):
             "Instance to segment into microstates sequence does not have "
             "the same coordinate frames as the instance used for fitting. "
         )
+
+
+def _get_data_raw(raw, picks, tmin=None, tmax=None, reject_by_annotation=None):
+    """Retrieve the data from a Raw instance, without copy when possible.
+
+    When the data is preloaded, the full recording is requested, no sample is
+    rejected and the picks are a contiguous range of channels, a read-only view on
+    the data buffer is returned instead of the copy made by ``raw.get_data()``.
+
+    Parameters
+    ----------
+    raw : Raw
+        The instance from which the data is retrieved.
+    picks : array of int
+        The indices of the channels to retrieve.
+    tmin : float | None
+        Start time of the data to retrieve.
+    tmax : float | None
+        End time of the data to retrieve.
+    reject_by_annotation : str | None
+        Either ``'omit'`` or None, c.f. :meth:`mne.io.Raw.get_data`.
+
+    Returns
+    -------
+    data : array of shape (n_channels, n_samples)
+        The data array, possibly a read-only view.
+    """
+    picks = np.atleast_1d(picks)
+    if (
+        raw.preload
+        and tmin is None
+        and tmax is None
+        and (reject_by_annotation is None or len(raw.annotations) == 0)
+        and picks.size != 0
+        and np.array_equal(picks, np.arange(picks[0], picks[0] + picks.size))
+    ):
+        data = raw._data[picks[0] : picks[0] + picks.size].view()
+        data.flags.writeable = False
+        return data
+    return raw.get_data(
+        picks=picks, tmin=tmin, tmax=tmax, reject_by_annotation=reject_by_annotation
+    )
+
+
+def _iter_data_epochs(epochs, picks, tmin=None, tmax=None):
+    """Iterate over the data of an Epochs instance, one epoch at a time.
+
+    Contrary to ``epochs.get_data()``, the data of all epochs is never loaded in a
+    single array. When the data is preloaded, each epoch is a read-only view on the
+    data buffer if the picks are a contiguous range of channels.
+
+    Parameters
+    ----------
+    epochs : Epochs
+        The instance from which the data is retrieved.
+    picks : array of int
+        The indices of the channels to retrieve.
+    tmin : float | None
+        Start time of the data to retrieve.
+    tmax : float | None
+        End time of the data to retrieve.
+
+    Yields
+    ------
+    data : array of shape (n_channels, n_samples)
+        The data array of an epoch, possibly a read-only view.
+    """
+    start, stop = epochs._handle_tmin_tmax(tmin, tmax)
+    picks = np.atleast_1d(picks)
+    if picks.size != 0 and np.array_equal(
+        picks, np.arange(picks[0], picks[0] + picks.size)
+    ):
+        picks = slice(picks[0], picks[0] + picks.size)
+    # iterating over non-preloaded epochs loads and rejects them one at a time
+    for epoch in epochs:
+        data = epoch[picks, start:stop]
+        if epochs.preload:
+            data.flags.writeable = False
+        yield data